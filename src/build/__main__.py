@@ -6,7 +6,6 @@ import argparse
 import contextlib
 import contextvars
 import os
-import platform
 import shutil
 import subprocess
 import sys
@@ -16,7 +15,7 @@ import traceback
 import warnings
 
 from collections.abc import Iterator, Sequence
-from functools import partial
+from functools import lru_cache, partial
 from typing import NoReturn, TextIO
 
 import build
@@ -73,7 +72,15 @@ if _max_terminal_width <= 0:
     _max_terminal_width = 78
 
 
-_fill = partial(textwrap.fill, subsequent_indent='  ', width=_max_terminal_width)
+@lru_cache(maxsize=None)
+def _text_wrapper(initial_indent: str) -> textwrap.TextWrapper:
+    return textwrap.TextWrapper(initial_indent=initial_indent, subsequent_indent='  ', width=_max_terminal_width)
+
+
+def _fill(text: str, *, initial_indent: str) -> str:
+    # ``textwrap.fill`` creates a new ``TextWrapper`` per call, reuse one per
+    # indent as every line of backend output goes through here.
+    return _text_wrapper(initial_indent).fill(text)
 
 
 def _log(message: str, *, origin: tuple[str, ...] | None = None) -> None:
@@ -93,7 +100,7 @@ def _log(message: str, *, origin: tuple[str, ...] | None = None) -> None:
 def _setup_cli(*, verbosity: int) -> None:
     warnings.showwarning = _showwarning
 
-    if platform.system() == 'Windows':
+    if sys.platform.startswith('win'):
         try:
             import colorama
 
@@ -122,20 +129,61 @@ def _format_dep_chain(dep_chain: Sequence[str]) -> str:
     return ' -> '.join(dep.partition(';')[0].strip() for dep in dep_chain)
 
 
+class _IsolatedEnvs:
+    """
+    The isolated environments of the builds in one ``build_package*`` call.
+
+    A build reuses the environment of an earlier one if both its build-system
+    and backend requirements are the same. The backend has already run in a
+    reused environment, so it may contain files left behind by earlier builds.
+    """
+
+    def __init__(self, installer: _env.Installer) -> None:
+        self._installer = installer
+        self._exit_stack = contextlib.ExitStack()
+        self._envs: dict[tuple[frozenset[str], frozenset[str]], DefaultIsolatedEnv] = {}
+
+    def __enter__(self) -> _IsolatedEnvs:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self._exit_stack.close()
+
+    def builder(self, srcdir: StrPath, distribution: Distribution, config_settings: ConfigSettings) -> ProjectBuilder:
+        """
+        Return a builder for ``srcdir`` in an environment with the requirements
+        for building ``distribution`` installed.
+        """
+        for (build_system_requires, requires), env in self._envs.items():
+            builder = ProjectBuilder.from_isolated_env(env, srcdir)
+            # what the backend requires can depend on what is already installed next
+            # to it, so only compare it with the environment it was reported in.
+            if (
+                builder.build_system_requires == build_system_requires
+                and set(builder.get_requires_for_build(distribution, config_settings)) == requires
+            ):
+                return builder
+
+        env = self._exit_stack.enter_context(DefaultIsolatedEnv(installer=self._installer))
+        builder = ProjectBuilder.from_isolated_env(env, srcdir)
+        # first install the build dependencies
+        env.install(builder.build_system_requires)
+        # then get the extra required dependencies from the backend (which was installed in the call above :P)
+        requires_for_build = builder.get_requires_for_build(distribution, config_settings)
+        env.install(requires_for_build)
+        self._envs[frozenset(builder.build_system_requires), frozenset(requires_for_build)] = env
+        return builder
+
+
 def _build_in_isolated_env(
     srcdir: StrPath,
     outdir: StrPath,
     distribution: Distribution,
     config_settings: ConfigSettings | None,
-    installer: _env.Installer,
+    envs: _IsolatedEnvs,
 ) -> str:
-    with DefaultIsolatedEnv(installer=installer) as env:
-        builder = ProjectBuilder.from_isolated_env(env, srcdir)
-        # first install the build dependencies
-        env.install(builder.build_system_requires)
-        # then get the extra required dependencies from the backend (which was installed in the call above :P)
-        env.install(builder.get_requires_for_build(distribution, config_settings or {}))
-        return builder.build(distribution, outdir, config_settings or {})
+    builder = envs.builder(srcdir, distribution, config_settings or {})
+    return builder.build(distribution, outdir, config_settings or {})
 
 
 def _build_in_current_env(
@@ -150,9 +198,9 @@ def _build_in_current_env(
     if not skip_dependency_check:
         missing = builder.check_dependencies(distribution, config_settings or {})
         if missing:
-            dependencies = ''.join('\n\t' + dep for deps in missing for dep in (deps[0], _format_dep_chain(deps[1:])) if dep)
+            dependencies = '\n\t'.join(dep for deps in missing for dep in (deps[0], _format_dep_chain(deps[1:])) if dep)
             _cprint()
-            _error(f'Missing dependencies:{dependencies}')
+            _error(f'Missing dependencies:\n\t{dependencies}')
 
     return builder.build(distribution, outdir, config_settings or {})
 
@@ -164,10 +212,10 @@ def _build(
     distribution: Distribution,
     config_settings: ConfigSettings | None,
     skip_dependency_check: bool,
-    installer: _env.Installer,
+    envs: _IsolatedEnvs,
 ) -> str:
     if isolation:
-        return _build_in_isolated_env(srcdir, outdir, distribution, config_settings, installer)
+        return _build_in_isolated_env(srcdir, outdir, distribution, config_settings, envs)
     else:
         return _build_in_current_env(srcdir, outdir, distribution, config_settings, skip_dependency_check)
 
@@ -234,9 +282,10 @@ def build_package(
     :param skip_dependency_check: Do not perform the dependency check
     """
     built: list[str] = []
-    for distribution in distributions:
-        out = _build(isolation, srcdir, outdir, distribution, config_settings, skip_dependency_check, installer)
-        built.append(os.path.basename(out))
+    with _IsolatedEnvs(installer) as envs:
+        for distribution in distributions:
+            out = _build(isolation, srcdir, outdir, distribution, config_settings, skip_dependency_check, envs)
+            built.append(os.path.basename(out))
     return built
 
 
@@ -265,23 +314,24 @@ def build_package_via_sdist(
         msg = 'Only binary distributions are allowed but sdist was specified'
         raise ValueError(msg)
 
-    sdist = _build(isolation, srcdir, outdir, 'sdist', config_settings, skip_dependency_check, installer)
-
-    sdist_name = os.path.basename(sdist)
-    sdist_out = tempfile.mkdtemp(prefix='build-via-sdist-')
-    built: list[str] = []
-    if distributions:
-        # extract sdist
-        with tarfile.TarFile.open(sdist) as t:
-            t.extractall(sdist_out)
-            try:
-                _ctx.log(f'Building {_natural_language_list(distributions)} from sdist')
-                srcdir = os.path.join(sdist_out, sdist_name[: -len('.tar.gz')])
-                for distribution in distributions:
-                    out = _build(isolation, srcdir, outdir, distribution, config_settings, skip_dependency_check, installer)
-                    built.append(os.path.basename(out))
-            finally:
-                shutil.rmtree(sdist_out, ignore_errors=True)
+    with _IsolatedEnvs(installer) as envs:
+        sdist = _build(isolation, srcdir, outdir, 'sdist', config_settings, skip_dependency_check, envs)
+
+        sdist_name = os.path.basename(sdist)
+        sdist_out = tempfile.mkdtemp(prefix='build-via-sdist-')
+        built: list[str] = []
+        if distributions:
+            # extract sdist
+            with tarfile.TarFile.open(sdist) as t:
+                t.extractall(sdist_out)
+                try:
+                    _ctx.log(f'Building {_natural_language_list(distributions)} from sdist')
+                    srcdir = os.path.join(sdist_out, sdist_name[: -len('.tar.gz')])
+                    for distribution in distributions:
+                        out = _build(isolation, srcdir, outdir, distribution, config_settings, skip_dependency_check, envs)
+                        built.append(os.path.basename(out))
+                finally:
+                    shutil.rmtree(sdist_out, ignore_errors=True)
     return [sdist_name, *built]
 
 
@@ -402,18 +452,15 @@ def main(cli_args: Sequence[str], prog: str | None = None) -> None:
 
     _setup_cli(verbosity=args.verbosity)
 
-    config_settings = {}
-
-    if args.config_settings:
-        for arg in args.config_settings:
-            setting, _, value = arg.partition('=')
-            if setting not in config_settings:
-                config_settings[setting] = value
-            else:
-                if not isinstance(config_settings[setting], list):
-                    config_settings[setting] = [config_settings[setting]]
-
-                config_settings[setting].append(value)
+    # collect the values of each setting in one pass, settings given once are
+    # passed as a string and repeated settings as a list.
+    config_setting_values: dict[str, list[str]] = {}
+    for arg in args.config_settings or ():
+        setting, _, value = arg.partition('=')
+        config_setting_values.setdefault(setting, []).append(value)
+    config_settings: ConfigSettings = {
+        setting: values[0] if len(values) == 1 else values for setting, values in config_setting_values.items()
+    }
 
     # outdir is relative to srcdir only if omitted.
     outdir = os.path.join(args.srcdir, 'dist') if args.outdir is None else args.outdir
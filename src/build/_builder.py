@@ -3,15 +3,15 @@
 from __future__ import annotations
 
 import contextlib
-import difflib
+import functools
 import os
+import stat
 import subprocess
 import sys
-import warnings
-import zipfile
+import types
 
-from collections.abc import Iterator
-from typing import Any, Mapping, Sequence, TypeVar
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from typing import Any, TypeVar
 
 import pyproject_hooks
 
@@ -24,7 +24,7 @@ from ._exceptions import (
     TypoWarning,
 )
 from ._types import ConfigSettings, Distribution, StrPath, SubprocessRunner
-from ._util import check_dependency, parse_wheel_filename
+from ._util import _check_dependencies, parse_wheel_filename
 
 
 _TProjectBuilder = TypeVar('_TProjectBuilder', bound='ProjectBuilder')
@@ -35,10 +35,36 @@ _DEFAULT_BACKEND = {
     'requires': ['setuptools >= 40.8.0'],
 }
 
+_KNOWN_BUILD_SYSTEM_KEYS = frozenset(('requires', 'build-backend', 'backend-path'))
+
+_HOOK_NAMES = (
+    'get_requires_for_build_sdist',
+    'get_requires_for_build_wheel',
+    'get_requires_for_build_editable',
+    'prepare_metadata_for_build_wheel',
+    'prepare_metadata_for_build_editable',
+    'build_sdist',
+    'build_wheel',
+    'build_editable',
+)
+
 
 def _find_typo(dictionary: Mapping[str, str], expected: str) -> None:
+    # Projects without a pyproject.toml have nothing to check, don't import
+    # difflib for them.
+    if not dictionary:
+        return
+
+    import difflib
+    import warnings
+
+    # Reuse one matcher and use the cheap upper bounds as a pre-filter. ``ratio``
+    # is not symmetric, so ``expected`` stays the first sequence.
+    matcher = difflib.SequenceMatcher()
+    matcher.set_seq1(expected)
     for obj in dictionary:
-        if difflib.SequenceMatcher(None, expected, obj).ratio() >= 0.8:
+        matcher.set_seq2(obj)
+        if matcher.real_quick_ratio() >= 0.8 and matcher.quick_ratio() >= 0.8 and matcher.ratio() >= 0.8:
             warnings.warn(
                 f"Found '{obj}' in pyproject.toml, did you mean '{expected}'?",
                 TypoWarning,
@@ -47,20 +73,35 @@ def _find_typo(dictionary: Mapping[str, str], expected: str) -> None:
 
 
 def _validate_source_directory(source_dir: StrPath) -> None:
-    if not os.path.isdir(source_dir):
-        msg = f'Source {source_dir} is not a directory'
-        raise BuildException(msg)
+    # A project file can only exist inside a directory, so in the common case
+    # a single ``stat`` validates both.
     pyproject_toml = os.path.join(source_dir, 'pyproject.toml')
     setup_py = os.path.join(source_dir, 'setup.py')
-    if not os.path.exists(pyproject_toml) and not os.path.exists(setup_py):
-        msg = f'Source {source_dir} does not appear to be a Python project: no pyproject.toml or setup.py'
+    if os.path.exists(pyproject_toml) or os.path.exists(setup_py):
+        return
+    if not os.path.isdir(source_dir):
+        msg = f'Source {source_dir} is not a directory'
         raise BuildException(msg)
+    msg = f'Source {source_dir} does not appear to be a Python project: no pyproject.toml or setup.py'
+    raise BuildException(msg)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_pyproject_toml(path: str, mtime_ns: int, size: int) -> Mapping[str, Any]:
+    # The modification time and size are part of the cache key so that
+    # edits to the file invalidate the cached result.
+    with open(path, 'rb') as f:
+        return types.MappingProxyType(tomllib.loads(f.read().decode()))
 
 
 def _read_pyproject_toml(path: StrPath) -> Mapping[str, Any]:
+    # A single ``stat`` finds legacy projects without a pyproject.toml and
+    # provides the cache key for everyone else.
     try:
-        with open(path, 'rb') as f:
-            return tomllib.loads(f.read().decode())
+        st = os.stat(path)
+        if not stat.S_ISREG(st.st_mode):
+            return {}
+        return _load_pyproject_toml(os.path.abspath(path), st.st_mtime_ns, st.st_size)
     except FileNotFoundError:
         return {}
     except PermissionError as e:
@@ -71,6 +112,11 @@ def _read_pyproject_toml(path: StrPath) -> Mapping[str, Any]:
         raise BuildException(msg) from None
 
 
+def _is_list_of_str(obj: object) -> bool:
+    # ``map(type, ...)`` runs in C, avoiding a Python-level generator per item.
+    return isinstance(obj, list) and set(map(type, obj)) <= {str}
+
+
 def _parse_build_system_table(pyproject_toml: Mapping[str, Any]) -> Mapping[str, Any]:
     # If pyproject.toml is missing (per PEP 517) or [build-system] is missing
     # (per PEP 518), use default values
@@ -85,9 +131,7 @@ def _parse_build_system_table(pyproject_toml: Mapping[str, Any]) -> Mapping[str,
         _find_typo(build_system_table, 'requires')
         msg = '`requires` is a required property'
         raise BuildSystemTableValidationError(msg)
-    elif not isinstance(build_system_table['requires'], list) or not all(
-        isinstance(i, str) for i in build_system_table['requires']
-    ):
+    elif not _is_list_of_str(build_system_table['requires']):
         msg = '`requires` must be an array of strings'
         raise BuildSystemTableValidationError(msg)
 
@@ -100,14 +144,11 @@ def _parse_build_system_table(pyproject_toml: Mapping[str, Any]) -> Mapping[str,
         msg = '`build-backend` must be a string'
         raise BuildSystemTableValidationError(msg)
 
-    if 'backend-path' in build_system_table and (
-        not isinstance(build_system_table['backend-path'], list)
-        or not all(isinstance(i, str) for i in build_system_table['backend-path'])
-    ):
+    if 'backend-path' in build_system_table and not _is_list_of_str(build_system_table['backend-path']):
         msg = '`backend-path` must be an array of strings'
         raise BuildSystemTableValidationError(msg)
 
-    unknown_props = build_system_table.keys() - {'requires', 'build-backend', 'backend-path'}
+    unknown_props = build_system_table.keys() - _KNOWN_BUILD_SYSTEM_KEYS
     if unknown_props:
         msg = f'Unknown properties: {", ".join(unknown_props)}'
         raise BuildSystemTableValidationError(msg)
@@ -158,10 +199,11 @@ class ProjectBuilder:
         self._python_executable = python_executable
         self._runner = runner
 
-        pyproject_toml_path = os.path.join(source_dir, 'pyproject.toml')
+        pyproject_toml_path = os.path.join(self._source_dir, 'pyproject.toml')
         self._build_system = _parse_build_system_table(_read_pyproject_toml(pyproject_toml_path))
 
         self._backend = self._build_system['build-backend']
+        self._build_system_requires = frozenset(self._build_system['requires'])
 
         self._hook = pyproject_hooks.BuildBackendHookCaller(
             self._source_dir,
@@ -170,6 +212,7 @@ class ProjectBuilder:
             python_executable=self._python_executable,
             runner=self._runner,
         )
+        self._hooks: dict[str, Callable[..., Any]] = {name: getattr(self._hook, name) for name in _HOOK_NAMES}
 
     @classmethod
     def from_isolated_env(
@@ -203,7 +246,7 @@ class ProjectBuilder:
         ``build-system.requires`` field or the default build dependencies
         if ``pyproject.toml`` is missing or ``build-system`` is undefined.
         """
-        return set(self._build_system['requires'])
+        return set(self._build_system_requires)
 
     def get_requires_for_build(
         self,
@@ -220,7 +263,7 @@ class ProjectBuilder:
         """
         _ctx.log(f'Getting build dependencies for {distribution}...')
         hook_name = f'get_requires_for_build_{distribution}'
-        get_requires = getattr(self._hook, hook_name)
+        get_requires = self._hooks[hook_name]
 
         with self._handle_backend(hook_name):
             return set(get_requires(config_settings))
@@ -239,8 +282,8 @@ class ProjectBuilder:
         :param config_settings: Config settings for the build backend
         :returns: Set of variable-length unmet dependency tuples
         """
-        dependencies = self.get_requires_for_build(distribution, config_settings).union(self.build_system_requires)
-        return {u for d in dependencies for u in check_dependency(d)}
+        dependencies = self.get_requires_for_build(distribution, config_settings).union(self._build_system_requires)
+        return set(_check_dependencies(dependencies))
 
     def prepare(
         self,
@@ -306,6 +349,8 @@ class ProjectBuilder:
             return metadata
 
         # fallback to build_wheel hook
+        import zipfile
+
         wheel = self.build('wheel', output_directory)
         match = parse_wheel_filename(os.path.basename(wheel))
         if not match:
@@ -316,7 +361,8 @@ class ProjectBuilder:
         with zipfile.ZipFile(wheel) as w:
             w.extractall(
                 output_directory,
-                (member for member in w.namelist() if member.startswith(member_prefix)),
+                # passing ``ZipInfo`` objects saves a ``getinfo`` lookup per member
+                (info for info in w.infolist() if info.filename.startswith(member_prefix)),
             )
         return os.path.join(output_directory, distinfo)
 
@@ -325,14 +371,18 @@ class ProjectBuilder:
     ) -> str:
         outdir = os.path.abspath(outdir)
 
-        callback = getattr(self._hook, hook_name)
+        callback = self._hooks[hook_name]
 
-        if os.path.exists(outdir):
-            if not os.path.isdir(outdir):
+        # A single ``stat`` covers the common case of an existing output directory;
+        # ``makedirs`` would stat the parent and attempt a ``mkdir`` first.
+        try:
+            outdir_is_dir = stat.S_ISDIR(os.stat(outdir).st_mode)
+        except FileNotFoundError:
+            os.makedirs(outdir, exist_ok=True)
+        else:
+            if not outdir_is_dir:
                 msg = f"Build path '{outdir}' exists and is not a directory"
                 raise BuildException(msg)
-        else:
-            os.makedirs(outdir)
 
         with self._handle_backend(hook_name):
             basename: str = callback(outdir, config_settings, **kwargs)
@@ -21,7 +21,7 @@ _default_logger = logging.getLogger(_package_name)
 
 def _log_default(message: str, *, origin: tuple[str, ...] | None = None) -> None:
     if origin is None:
-        _default_logger.log(logging.INFO, message, stacklevel=2)
+        _default_logger.info(message, stacklevel=2)
 
 
 LOGGER = contextvars.ContextVar('LOGGER', default=_log_default)
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
-import subprocess
-import types
+import typing
+
+
+if typing.TYPE_CHECKING:
+    import subprocess
+    import types
 
 
 class BuildException(Exception):
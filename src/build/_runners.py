@@ -0,0 +1,223 @@
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import typing
+
+from collections.abc import Mapping, Sequence
+
+import pyproject_hooks
+
+
+# Executed with ``python -c`` in the backend's interpreter. Every request runs a
+# hook script (the ``pyproject_hooks`` in-process script) with ``runpy`` so the
+# backend module stays imported between hooks. The hook's stdout and stderr are
+# redirected to files named in the request and the exit code is written back
+# on a private duplicate of the original stdout. Requests are likewise read from
+# a private duplicate of the original stdin, hooks (and the processes they
+# start) get ``os.devnull`` so reading from stdin doesn't block on the requests.
+_DAEMON_SCRIPT = """\
+import json, os, runpy, sys, traceback
+
+# ``-c`` puts the working directory first on the path, ``python script.py`` would not
+del sys.path[0]
+
+protocol = os.fdopen(os.dup(1), 'w')
+os.dup2(2, 1)
+requests = os.fdopen(os.dup(0))
+null = os.open(os.devnull, os.O_RDONLY)
+os.dup2(null, 0)
+os.close(null)
+
+base_cwd = os.getcwd()
+base_environ = dict(os.environ)
+base_path = list(sys.path)
+base_meta_path = list(sys.meta_path)
+
+for line in requests:
+    request = json.loads(line)
+    os.environ.clear()
+    os.environ.update(base_environ)
+    os.environ.update(request['env'])
+    os.chdir(base_cwd if request['cwd'] is None else request['cwd'])
+    sys.argv = request['argv'][1:]
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved_fds = os.dup(1), os.dup(2)
+    with open(request['stdout'], 'wb') as out, open(request['stderr'], 'wb') as err:
+        os.dup2(out.fileno(), 1)
+        os.dup2(err.fileno(), 2)
+        try:
+            runpy.run_path(sys.argv[0], run_name='__main__')
+            code = 0
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                code = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+                code = 1
+        except BaseException:
+            traceback.print_exc()
+            code = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(saved_fds[0], 1)
+            os.dup2(saved_fds[1], 2)
+            os.close(saved_fds[0])
+            os.close(saved_fds[1])
+
+    sys.path[:] = base_path
+    sys.meta_path[:] = base_meta_path
+    protocol.write(json.dumps(code) + '\\n')
+    protocol.flush()
+"""
+
+
+class DaemonRunner:
+    """
+    Subprocess runner which invokes every hook in one long-lived interpreter.
+
+    The default runners spawn a new Python process, which then imports the
+    backend, for every hook call. This runner starts a single process per
+    Python executable on first use and reuses it for the following hooks, so
+    the backend is only imported once.
+
+    Hooks share the interpreter state of the backend, so a runner must only be
+    used for a single project. Output of the hooks is forwarded to
+    :data:`sys.stdout` and :data:`sys.stderr` once each hook has completed.
+
+    The runner should be closed after use, either by calling :meth:`close` or
+    by using it as a context manager.
+    """
+
+    def __init__(self) -> None:
+        self._processes: dict[str, subprocess.Popen[str]] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> DaemonRunner:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def __call__(self, cmd: Sequence[str], cwd: str | None = None, extra_environ: Mapping[str, str] | None = None) -> None:
+        with self._lock, tempfile.TemporaryDirectory(prefix='build-daemon-') as output_dir:
+            stdout_path = os.path.join(output_dir, 'stdout')
+            stderr_path = os.path.join(output_dir, 'stderr')
+
+            process = self._get_process(cmd[0])
+            request = {
+                'argv': list(cmd),
+                'cwd': cwd,
+                'env': dict(extra_environ or {}),
+                'stdout': stdout_path,
+                'stderr': stderr_path,
+            }
+            stdin = typing.cast(typing.IO[str], process.stdin)
+            try:
+                stdin.write(json.dumps(request) + '\n')
+                stdin.flush()
+                response = typing.cast(typing.IO[str], process.stdout).readline()
+            except OSError:
+                response = ''
+
+            if response:
+                code = json.loads(response)
+            else:
+                # the daemon died, start a new one for the next hook
+                del self._processes[cmd[0]]
+                code = process.wait() or 1
+
+            stdout = _read_output(stdout_path)
+            stderr = _read_output(stderr_path)
+
+        if stdout:
+            sys.stdout.write(stdout)
+            sys.stdout.flush()
+        if stderr:
+            sys.stderr.write(stderr)
+            sys.stderr.flush()
+
+        if code:
+            raise subprocess.CalledProcessError(code, list(cmd), stdout, stderr)
+
+    def _get_process(self, python_executable: str) -> subprocess.Popen[str]:
+        process = self._processes.get(python_executable)
+        if process is None:
+            process = self._processes[python_executable] = subprocess.Popen(
+                [python_executable, '-c', _DAEMON_SCRIPT],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                encoding='utf-8',
+            )
+        return process
+
+    def close(self) -> None:
+        """Shut down the interpreters started by this runner."""
+        with self._lock:
+            processes, self._processes = self._processes, {}
+        for process in processes.values():
+            typing.cast(typing.IO[str], process.stdin).close()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:  # pragma: no cover
+                process.kill()
+                process.wait()
+            typing.cast(typing.IO[str], process.stdout).close()
+
+
+def in_process_runner(cmd: Sequence[str], cwd: str | None = None, extra_environ: Mapping[str, str] | None = None) -> None:
+    """
+    Subprocess runner which invokes hooks in the current interpreter.
+
+    This avoids starting a new Python process and importing the backend for
+    every hook, but the backend is imported into, and can freely modify, the
+    running interpreter. Only use it for trusted projects built without
+    isolation. Commands for a different Python executable, e.g. that of an
+    isolated environment, are still run in a subprocess.
+    """
+    if cmd[0] != sys.executable:
+        pyproject_hooks.default_subprocess_runner(cmd, cwd, extra_environ)
+        return
+
+    import runpy
+
+    environ = os.environ.copy()
+    current_dir = os.getcwd()
+    argv, path, meta_path = sys.argv, sys.path[:], sys.meta_path[:]
+    try:
+        os.environ.update(extra_environ or {})
+        if cwd is not None:
+            os.chdir(cwd)
+        sys.argv = list(cmd[1:])
+        runpy.run_path(cmd[1], run_name='__main__')
+    except SystemExit as e:
+        if e.code:
+            raise subprocess.CalledProcessError(e.code if isinstance(e.code, int) else 1, list(cmd)) from None
+    finally:
+        os.environ.clear()
+        os.environ.update(environ)
+        os.chdir(current_dir)
+        sys.argv, sys.path[:], sys.meta_path[:] = argv, path, meta_path
+
+
+def _read_output(path: str) -> str:
+    try:
+        with open(path, 'rb') as f:
+            return f.read().decode(errors='replace')
+    except FileNotFoundError:
+        return ''
+
+
+__all__ = [
+    'DaemonRunner',
+    'in_process_runner',
+]
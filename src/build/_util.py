@@ -1,17 +1,51 @@
 from __future__ import annotations
 
+import functools
 import re
+import typing
 
-from collections.abc import Iterator, Set
+from collections.abc import Iterable, Iterator, Set
 
 
-_WHEEL_FILENAME_REGEX = re.compile(
+if typing.TYPE_CHECKING:
+    from packaging.markers import Marker
+    from packaging.requirements import Requirement
+
+    from ._compat.importlib import metadata
+
+
+_WHEEL_FILENAME_FIELDS = ('distribution', 'version', 'build_tag', 'python_tag', 'abi_tag', 'platform_tag')
+
+
+# only compiled (and cached by ``re``) when a filename doesn't split cleanly.
+_WHEEL_FILENAME_REGEX = (
     r'(?P<distribution>.+)-(?P<version>.+)'
     r'(-(?P<build_tag>.+))?-(?P<python_tag>.+)'
     r'-(?P<abi_tag>.+)-(?P<platform_tag>.+)\.whl'
 )
 
 
+def _evaluate_marker(marker: Marker, extra: str) -> bool:
+    return _evaluate_marker_string(str(marker), extra)
+
+
+@functools.lru_cache(maxsize=1024)
+def _evaluate_marker_string(marker_string: str, extra: str) -> bool:
+    # markers only depend on the environment, which is fixed for the lifetime of
+    # the process, and the extra they are evaluated for.
+    import packaging.markers
+
+    return packaging.markers.Marker(marker_string).evaluate(environment={'extra': extra})
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_requirement(req_string: str) -> Requirement:
+    # requirement strings repeat heavily across transitive dependency checks
+    import packaging.requirements
+
+    return packaging.requirements.Requirement(req_string)
+
+
 def check_dependency(
     req_string: str, ancestral_req_strings: tuple[str, ...] = (), parent_extras: Set[str] = frozenset()
 ) -> Iterator[tuple[str, ...]]:
@@ -22,42 +56,172 @@ def check_dependency(
     :param parent_extras: Extras (eg. "test" in myproject[test])
     :yields: Unmet dependencies
     """
-    import packaging.requirements
+    return _check_dependencies((req_string,), ancestral_req_strings, parent_extras)
 
-    from ._compat import importlib
-
-    req = packaging.requirements.Requirement(req_string)
-    normalised_req_string = str(req)
-
-    # ``Requirement`` doesn't implement ``__eq__`` so we cannot compare reqs for
-    # equality directly but the string representation is stable.
-    if normalised_req_string in ancestral_req_strings:
-        # cyclical dependency, already checked.
-        return
-
-    if req.marker:
-        extras = frozenset(('',)).union(parent_extras)
-        # a requirement can have multiple extras but ``evaluate`` can
-        # only check one at a time.
-        if all(not req.marker.evaluate(environment={'extra': e}) for e in extras):
-            # if the marker conditions are not met, we pretend that the
-            # dependency is satisfied.
-            return
-
-    try:
-        dist = importlib.metadata.distribution(req.name)
-    except importlib.metadata.PackageNotFoundError:
-        # dependency is not installed in the environment.
-        yield (*ancestral_req_strings, normalised_req_string)
-    else:
-        if req.specifier and not req.specifier.contains(dist.version, prereleases=True):
+
+def _check_dependencies(
+    req_strings: Iterable[str], ancestral_req_strings: tuple[str, ...] = (), parent_extras: Set[str] = frozenset()
+) -> Iterator[tuple[str, ...]]:
+    """
+    Verify that several dependencies and all of their dependencies are met,
+    sharing lookups between them.
+    """
+    return _DependencyChecker(ancestral_req_strings).check(req_strings, parent_extras)
+
+
+class _Frame(typing.NamedTuple):
+    """
+    A requirement whose dependencies are being walked.
+    """
+
+    req_string: str
+    key: tuple[str, frozenset[str]]
+    # the unmet dependency chains found below the requirement so far.
+    unmet: list[tuple[str, ...]]
+    # the dependencies still to walk and the extras their markers are evaluated against.
+    remaining: Iterator[str]
+    extras: Set[str]
+    # the requirements walked below it, and those it stopped at as cyclical dependencies.
+    walked: set[str]
+    cut: set[str]
+
+
+class _DependencyChecker:
+    """
+    Walks the dependencies of several requirements, remembering distribution
+    lookups and the outcome of shared requirements for the rest of the walk.
+    """
+
+    def __init__(self, ancestral_req_strings: tuple[str, ...]) -> None:
+        self._ancestral_req_strings = ancestral_req_strings
+        # the unmet dependency chains found below each requirement, relative to it,
+        # keyed on the requirement and the extras its markers are evaluated against,
+        # with the requirements walked to find them and the requirements outside of
+        # the walk that it stopped at as cyclical dependencies.
+        self._results: dict[tuple[str, frozenset[str]], tuple[list[tuple[str, ...]], Set[str], Set[str]]] = {}
+        self._distributions: dict[str, metadata.Distribution | None] = {}
+        # the requirements leading to the one being checked, for cycle detection.
+        self._ancestors = set(ancestral_req_strings)
+        # the requirements whose dependencies are being walked, innermost last.
+        # An explicit stack keeps deep dependency chains clear of the recursion limit.
+        self._stack: list[_Frame] = []
+
+    def check(self, req_strings: Iterable[str], parent_extras: Set[str]) -> Iterator[tuple[str, ...]]:
+        for req_string in req_strings:
+            yield from self._report(self._check(req_string, parent_extras))
+            while self._stack:
+                frame = self._stack[-1]
+                other_req_string = next(frame.remaining, None)
+                if other_req_string is None:
+                    self._finish()
+                    continue
+                # yields transitive dependencies that are not satisfied.
+                yield from self._report(self._check(other_req_string, frame.extras))
+
+    def _find_distribution(self, name: str) -> metadata.Distribution | None:
+        from packaging.utils import canonicalize_name
+
+        from ._compat import importlib
+
+        # looking up a distribution scans every ``sys.path`` entry, remember the
+        # result (including missing distributions) for the rest of the check.
+        key = canonicalize_name(name)
+        if key not in self._distributions:
+            try:
+                self._distributions[key] = importlib.metadata.distribution(name)
+            except importlib.metadata.PackageNotFoundError:
+                self._distributions[key] = None
+        return self._distributions[key]
+
+    def _check(self, req_string: str, parent_extras: Set[str]) -> list[tuple[str, ...]]:
+        # returns the unmet dependency chains below the requirement, relative to
+        # it, unless its dependencies still need to be walked, in which case it
+        # is pushed onto the stack and its chains are collected as they are found.
+        req = _parse_requirement(req_string)
+        normalised_req_string = str(req)
+
+        # ``Requirement`` doesn't implement ``__eq__`` so we cannot compare reqs for
+        # equality directly but the string representation is stable.
+        if normalised_req_string in self._ancestors:
+            # cyclical dependency, already checked.
+            self._merge(set(), {normalised_req_string})
+            return []
+
+        # the outcome only depends on the requirement and the extras its markers
+        # are evaluated against, so a requirement shared by several dependencies
+        # is only explored once and its unmet dependencies replayed afterwards,
+        # as long as the cyclical dependencies it stopped at are the same.
+        key = (normalised_req_string, frozenset(parent_extras))
+        if key in self._results:
+            unmet, walked, cut = self._results[key]
+            if cut <= self._ancestors and walked.isdisjoint(self._ancestors):
+                self._merge(walked, cut)
+                return unmet
+
+        unmet = []
+        if req.marker:
+            extras = frozenset(('',)).union(parent_extras)
+            # a requirement can have multiple extras but ``evaluate`` can
+            # only check one at a time.
+            if all(not _evaluate_marker(req.marker, e) for e in extras):
+                # if the marker conditions are not met, we pretend that the
+                # dependency is satisfied.
+                return self._store(key, unmet)
+
+        dist = self._find_distribution(req.name)
+        if dist is None:
+            # dependency is not installed in the environment.
+            unmet.append((normalised_req_string,))
+        elif req.specifier and not req.specifier.contains(dist.version, prereleases=True):
             # the installed version is incompatible.
-            yield (*ancestral_req_strings, normalised_req_string)
+            unmet.append((normalised_req_string,))
         elif dist.requires:
-            for other_req_string in dist.requires:
-                # yields transitive dependencies that are not satisfied.
-                yield from check_dependency(other_req_string, (*ancestral_req_strings, normalised_req_string), req.extras)
+            # transitive dependencies are checked by the caller.
+            self._ancestors.add(normalised_req_string)
+            self._stack.append(_Frame(normalised_req_string, key, unmet, iter(dist.requires), req.extras, set(), set()))
+            return []
+        return self._store(key, unmet)
+
+    def _store(self, key: tuple[str, frozenset[str]], unmet: list[tuple[str, ...]]) -> list[tuple[str, ...]]:
+        walked = {key[0]}
+        self._results[key] = (unmet, walked, set())
+        self._merge(walked, set())
+        return unmet
+
+    def _finish(self) -> None:
+        frame = self._stack.pop()
+        self._ancestors.remove(frame.req_string)
+        frame.walked.add(frame.req_string)
+        # requirements walked below this one were stopped at on the way back up
+        # to it, only those outside of the walk matter to the other parents.
+        frame.cut.difference_update(frame.walked)
+        self._results[frame.key] = (frame.unmet, frame.walked, frame.cut)
+        self._merge(frame.walked, frame.cut)
+
+    def _merge(self, walked: Set[str], cut: Set[str]) -> None:
+        if self._stack:
+            parent = self._stack[-1]
+            parent.walked.update(walked)
+            parent.cut.update(cut)
+
+    def _report(self, chains: list[tuple[str, ...]]) -> Iterator[tuple[str, ...]]:
+        for chain in chains:
+            # record the chain below every requirement on the stack, relative to it.
+            for parent in reversed(self._stack):
+                chain = (parent.req_string, *chain)
+                parent.unmet.append(chain)
+            yield (*self._ancestral_req_strings, *chain)
+
 
+def parse_wheel_filename(filename: str) -> dict[str, str | None] | None:
+    if filename.endswith('.whl'):
+        # The components of a well-formed wheel filename never contain dashes,
+        # so a plain split is enough and the build tag is the only optional field.
+        parts: list[str | None] = [*filename[: -len('.whl')].split('-')]
+        if len(parts) == 5:
+            parts.insert(2, None)
+        if len(parts) == 6:
+            return dict(zip(_WHEEL_FILENAME_FIELDS, parts))
 
-def parse_wheel_filename(filename: str) -> re.Match[str] | None:
-    return _WHEEL_FILENAME_REGEX.match(filename)
+    match = re.match(_WHEEL_FILENAME_REGEX, filename)
+    return match.groupdict() if match else None
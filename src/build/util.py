@@ -9,6 +9,7 @@ import pyproject_hooks
 
 from . import ProjectBuilder
 from ._compat import importlib
+from ._runners import DaemonRunner, in_process_runner
 from ._types import StrPath, SubprocessRunner
 from .env import DefaultIsolatedEnv
 
@@ -57,5 +58,7 @@ def project_wheel_metadata(
 
 
 __all__ = [
+    'DaemonRunner',
+    'in_process_runner',
     'project_wheel_metadata',
 ]
@@ -149,6 +149,32 @@ def test_build_isolated(mocker, package_test_flit):
     build_cmd.assert_called_with('sdist', '.', {})
 
 
+@pytest.mark.isolated
+@pytest.mark.parametrize(
+    ('requires', 'env_count'),
+    [
+        ([['dep1', 'dep2'], ['dep2', 'dep1']], 1),
+        # the backend no longer asks for ``ninja`` next to the one installed for
+        # the sdist, but a new environment for the wheel still needs it.
+        ([['ninja'], [], ['ninja']], 2),
+    ],
+)
+def test_build_isolated_reuses_env(mocker, package_test_flit, requires, env_count):
+    mocker.patch('build.ProjectBuilder.build', return_value='something')
+    get_requires = mocker.patch('build.ProjectBuilder.get_requires_for_build', side_effect=requires)
+    install = mocker.patch('build.env.DefaultIsolatedEnv.install')
+    enter = mocker.spy(build.env.DefaultIsolatedEnv, '__enter__')
+
+    build.__main__.build_package(package_test_flit, '.', ['sdist', 'wheel'])
+
+    # an environment is only reused if it has the same requirements installed
+    assert enter.call_count == env_count
+    assert install.call_count == 2 * env_count
+    # and a new environment installs what the backend asks for in it
+    assert get_requires.call_count == len(requires)
+    assert set(install.call_args.args[0]) == set(requires[-1])
+
+
 def test_build_no_isolation_check_deps_empty(mocker, package_test_flit):
     # check_dependencies = []
     build_cmd = mocker.patch('build.ProjectBuilder.build', return_value='something')
@@ -13,6 +13,7 @@ import pytest
 
 import build
 import build._builder
+import build._util
 
 from build._compat import importlib as _importlib
 
@@ -32,18 +33,21 @@ class MockDistribution(_importlib.metadata.Distribution):
 
     @classmethod
     def from_name(cls, name):
-        if name == 'extras_dep':
-            return ExtraMockDistribution()
-        elif name == 'requireless_dep':
-            return RequirelessMockDistribution()
-        elif name == 'recursive_dep':
-            return RecursiveMockDistribution()
-        elif name == 'prerelease_dep':
-            return PrereleaseMockDistribution()
-        elif name == 'circular_dep':
-            return CircularMockDistribution()
-        elif name == 'nested_circular_dep':
-            return NestedCircularMockDistribution()
+        distributions = {
+            'extras_dep': ExtraMockDistribution,
+            'requireless_dep': RequirelessMockDistribution,
+            'recursive_dep': RecursiveMockDistribution,
+            'diamond_dep': DiamondMockDistribution,
+            'prerelease_dep': PrereleaseMockDistribution,
+            'circular_dep': CircularMockDistribution,
+            'nested_circular_dep': NestedCircularMockDistribution,
+            'shared_circular_dep': SharedCircularMockDistribution,
+            'nested_shared_circular_dep': NestedSharedCircularMockDistribution,
+        }
+        if name in distributions:
+            return distributions[name]()
+        elif name.startswith('chain_dep_') and int(name[len('chain_dep_') :]) < sys.getrecursionlimit() + 1:
+            return ChainMockDistribution(int(name[len('chain_dep_') :]))
         raise _importlib.metadata.PackageNotFoundError
 
 
@@ -91,6 +95,19 @@ class RecursiveMockDistribution(MockDistribution):
             ).strip()
 
 
+class DiamondMockDistribution(MockDistribution):
+    def read_text(self, filename):
+        if filename == 'METADATA':
+            return textwrap.dedent(
+                """
+                Metadata-Version: 2.2
+                Name: diamond_dep
+                Version: 1.0.0
+                Requires-Dist: recursive_dep
+                """
+            ).strip()
+
+
 class PrereleaseMockDistribution(MockDistribution):
     def read_text(self, filename):
         if filename == 'METADATA':
@@ -129,6 +146,49 @@ class NestedCircularMockDistribution(MockDistribution):
             ).strip()
 
 
+class SharedCircularMockDistribution(MockDistribution):
+    def read_text(self, filename):
+        if filename == 'METADATA':
+            return textwrap.dedent(
+                """
+                Metadata-Version: 2.2
+                Name: shared_circular_dep
+                Version: 1.0.0
+                Requires-Dist: nested_shared_circular_dep
+                Requires-Dist: circular_unmet_dep
+                """
+            ).strip()
+
+
+class NestedSharedCircularMockDistribution(MockDistribution):
+    def read_text(self, filename):
+        if filename == 'METADATA':
+            return textwrap.dedent(
+                """
+                Metadata-Version: 2.2
+                Name: nested_shared_circular_dep
+                Version: 1.0.0
+                Requires-Dist: shared_circular_dep
+                """
+            ).strip()
+
+
+class ChainMockDistribution(MockDistribution):
+    def __init__(self, depth):
+        self._depth = depth
+
+    def read_text(self, filename):
+        if filename == 'METADATA':
+            return textwrap.dedent(
+                f"""
+                Metadata-Version: 2.2
+                Name: chain_dep_{self._depth}
+                Version: 1.0.0
+                Requires-Dist: chain_dep_{self._depth + 1}
+                """
+            ).strip()
+
+
 @pytest.mark.parametrize(
     ('requirement_string', 'expected'),
     [
@@ -167,6 +227,72 @@ def test_check_dependency(monkeypatch, requirement_string, expected):
     assert next(build.check_dependency(requirement_string), None) == expected
 
 
+def test_check_dependency_checks_shared_requirements_once(monkeypatch, mocker):
+    monkeypatch.setattr(_importlib.metadata, 'Distribution', MockDistribution)
+    from_name = mocker.spy(MockDistribution, 'from_name')
+
+    unmet = list(build._util._check_dependencies(['recursive_dep', 'recursive_dep']))
+    assert unmet == [('recursive_dep', 'recursive_unmet_dep')] * 2
+    assert from_name.call_count == 2
+
+
+@pytest.mark.parametrize(
+    ('req_strings', 'expected'),
+    [
+        (
+            ['diamond_dep', 'recursive_dep'],
+            [('diamond_dep', 'recursive_dep', 'recursive_unmet_dep'), ('recursive_dep', 'recursive_unmet_dep')],
+        ),
+        (
+            ['recursive_dep', 'diamond_dep'],
+            [('recursive_dep', 'recursive_unmet_dep'), ('diamond_dep', 'recursive_dep', 'recursive_unmet_dep')],
+        ),
+    ],
+)
+def test_check_dependency_reports_shared_requirements_per_parent(monkeypatch, req_strings, expected):
+    monkeypatch.setattr(_importlib.metadata, 'Distribution', MockDistribution)
+
+    assert list(build._util._check_dependencies(req_strings)) == expected
+
+
+def test_check_dependency_caches_distributions(monkeypatch, mocker):
+    monkeypatch.setattr(_importlib.metadata, 'Distribution', MockDistribution)
+    from_name = mocker.spy(MockDistribution, 'from_name')
+
+    unmet = list(build._util._check_dependencies(['recursive_dep', 'Recursive_Dep >= 1']))
+    assert unmet == [('recursive_dep', 'recursive_unmet_dep'), ('Recursive_Dep>=1', 'recursive_unmet_dep')]
+    assert from_name.call_count == 2
+
+
+@pytest.mark.parametrize(
+    'req_strings',
+    [
+        ['shared_circular_dep', 'nested_shared_circular_dep'],
+        ['nested_shared_circular_dep', 'shared_circular_dep'],
+    ],
+)
+def test_check_dependency_shared_circular(monkeypatch, req_strings):
+    monkeypatch.setattr(_importlib.metadata, 'Distribution', MockDistribution)
+
+    # a requirement checked while one of its dependencies was on the stack must
+    # not be replayed without that dependency's unmet dependencies.
+    unmet = set(build._util._check_dependencies(req_strings))
+    assert unmet == {
+        ('shared_circular_dep', 'circular_unmet_dep'),
+        ('nested_shared_circular_dep', 'shared_circular_dep', 'circular_unmet_dep'),
+    }
+
+
+def test_check_dependency_deep_chain(monkeypatch):
+    monkeypatch.setattr(_importlib.metadata, 'Distribution', MockDistribution)
+    depth = sys.getrecursionlimit() + 1
+
+    # one more installed distribution than the recursion limit, the last one
+    # depends on a missing distribution.
+    (unmet,) = build.check_dependency('chain_dep_0')
+    assert unmet == tuple(f'chain_dep_{i}' for i in range(depth + 1))
+
+
 def test_bad_project(package_test_no_project):
     # Passing a nonexistent project directory
     with pytest.raises(build.BuildException):
@@ -216,6 +342,18 @@ def test_init(mocker, package_test_flit, package_legacy, test_no_permission, pac
         build.ProjectBuilder(package_test_bad_syntax)
 
 
+def test_read_pyproject_toml_cached(tmp_path):
+    pyproject_toml = tmp_path / 'pyproject.toml'
+    pyproject_toml.write_text('[build-system]\nrequires = []\n', encoding='utf-8')
+
+    pyproject = build._builder._read_pyproject_toml(pyproject_toml)
+    assert build._builder._read_pyproject_toml(pyproject_toml) is pyproject
+
+    # modifying the file invalidates the cached result
+    pyproject_toml.write_text('[build-system]\nrequires = ["foo"]\n', encoding='utf-8')
+    assert build._builder._read_pyproject_toml(pyproject_toml) == {'build-system': {'requires': ['foo']}}
+
+
 def test_init_makes_source_dir_absolute(package_test_flit):
     rel_dir = os.path.relpath(package_test_flit, os.getcwd())
     assert not os.path.isabs(rel_dir)
@@ -329,6 +467,20 @@ def test_build_system_typo(mocker, package_test_typo):
         build.ProjectBuilder(package_test_typo)
 
 
+@pytest.mark.parametrize(
+    ('key', 'warns'),
+    [
+        # ``SequenceMatcher.ratio`` is not symmetric, these pairs score either side
+        # of the threshold depending on the order of the sequences.
+        ('cbild-sysmtm', True),
+        ('builldseysytem', False),
+    ],
+)
+def test_find_typo_ratio_order(recwarn, key, warns):
+    build._builder._find_typo({key: {}}, 'build-system')
+    assert bool(recwarn.list) == warns
+
+
 def test_missing_outdir(mocker, tmp_dir, package_test_flit):
     mocker.patch('pyproject_hooks.BuildBackendHookCaller', autospec=True)
 
@@ -538,6 +690,23 @@ def test_metadata_invalid_wheel(tmp_dir, package_test_bad_wheel):
         builder.metadata_path(tmp_dir)
 
 
+@pytest.mark.parametrize(
+    ('filename', 'expected'),
+    [
+        ('foo-1.0-py3-none-any.whl', ('foo', '1.0', None)),
+        ('foo-1.0-1-py3-none-any.whl', ('foo', '1.0', '1')),
+        ('foo-1.0.whl', None),
+        ('not a wheel', None),
+    ],
+)
+def test_parse_wheel_filename(filename, expected):
+    parsed = build._util.parse_wheel_filename(filename)
+    if expected is None:
+        assert parsed is None
+    else:
+        assert (parsed['distribution'], parsed['version'], parsed['build_tag']) == expected
+
+
 def test_log(mocker, caplog, package_test_flit):
     mocker.patch('pyproject_hooks.BuildBackendHookCaller', autospec=True)
     mocker.patch('build.ProjectBuilder._call_backend', return_value='some_path')
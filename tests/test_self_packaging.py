@@ -54,6 +54,7 @@ wheel_files = {
     'build/_compat/tomllib.py',
     'build/_ctx.py',
     'build/_exceptions.py',
+    'build/_runners.py',
     'build/_types.py',
     'build/_util.py',
     'build/env.py',
@@ -1,6 +1,8 @@
 # SPDX-License-Identifier: MIT
 
 import importlib.util
+import subprocess
+import sys
 
 import pytest
 
@@ -47,3 +49,63 @@ def test_with_get_requires(package_test_metadata):
     assert str(metadata['version']) == '1.0.0'
     assert metadata['summary'] == 'hello!'
     assert isinstance(metadata.json, dict)
+
+
+def test_daemon_runner_reuses_interpreter(tmp_dir, package_test_no_prepare):
+    with build.util.DaemonRunner() as runner:
+        builder = build.ProjectBuilder(package_test_no_prepare, runner=runner)
+        assert builder.get_requires_for_build('wheel') == set()
+        metadata = build.util._project_wheel_metadata(builder)
+
+        assert len(runner._processes) == 1
+
+    assert metadata['name'] == 'test-no-prepare'
+    assert runner._processes == {}
+
+
+def test_daemon_runner_failure(tmp_path, capfd):
+    failing_script = tmp_path / 'failing.py'
+    failing_script.write_text('import sys\nprint("some output")\nsys.exit(3)\n', encoding='utf-8')
+    script = tmp_path / 'script.py'
+    script.write_text('', encoding='utf-8')
+
+    with build.util.DaemonRunner() as runner:
+        with pytest.raises(subprocess.CalledProcessError) as excinfo:
+            runner([sys.executable, str(failing_script)])
+        # the interpreter survives a failing script
+        runner([sys.executable, str(script)])
+
+        assert len(runner._processes) == 1
+
+    assert excinfo.value.returncode == 3
+    assert excinfo.value.output == 'some output\n'
+    assert capfd.readouterr().out == 'some output\n'
+
+
+def test_daemon_runner_stdin(tmp_path, capfd):
+    script = tmp_path / 'script.py'
+    script.write_text(
+        'import subprocess, sys\n'
+        'print(repr(sys.stdin.read()))\n'
+        'subprocess.run([sys.executable, "-c", "import sys; print(repr(sys.stdin.read()))"])\n',
+        encoding='utf-8',
+    )
+
+    # neither the hook nor its subprocesses read the requests sent to the daemon
+    with build.util.DaemonRunner() as runner:
+        runner([sys.executable, str(script)])
+        runner([sys.executable, str(script)])
+
+    assert capfd.readouterr().out == "''\n''\n" * 2
+
+
+def test_in_process_runner(tmp_dir, package_test_no_prepare):
+    builder = build.ProjectBuilder(package_test_no_prepare, runner=build.util.in_process_runner)
+    try:
+        metadata = build.util._project_wheel_metadata(builder)
+
+        assert metadata['name'] == 'test-no-prepare'
+        assert 'backend_no_prepare' in sys.modules
+    finally:
+        # the backend is imported into this process, don't leak it into other tests.
+        sys.modules.pop('backend_no_prepare', None)